@@ -27,7 +27,7 @@ if __name__ == '__main__':
         maintainer_email='crap0101@riseup.net',
         license='MIT-like License',
         platforms=['platform independent'],
-        requires=['pygame(>=1.7)'], #optional: 'pygtk(>=2.0.0)'],
+        requires=['pygame(>=1.9.4)'], #optional: 'pygtk(>=2.0.0)'],
         package_dir={'bumpo': 'src'},
         packages = ['bumpo', 'bumpo.plugins'],
         )
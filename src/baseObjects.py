@@ -23,6 +23,9 @@ import pygame
 
 Velocity = namedtuple('Velocity', 'x y')
 
+_randint = random.randint
+_RECT_ATTRS = frozenset(SHAPE_RECT_ATTRS)
+
 class ShapeMeta (type):
     """
     Shape metaclass used for set SHAPE_RECT_ATTRS attributes
@@ -50,6 +53,8 @@ class Shape (metaclass=ShapeMeta):
         Raise TypeError for a non conforming object obj.
         """
         self._alpha_flag = 0
+        # a surface shared with someone else, copied before any change.
+        self._shared_surface = None
         if obj is None:
             self._surface = pygame.Surface((0,0))
             self._rect = self._surface.get_rect()
@@ -87,6 +92,7 @@ class Shape (metaclass=ShapeMeta):
         0 is fully transparent and 255 is fully opaque.
         If None is passed for the alpha value, then the alpha will be disabled.
         """
+        self._unshare()
         self._surface.set_alpha(a)
 
     def get_alpha_flag (self):
@@ -102,6 +108,7 @@ class Shape (metaclass=ShapeMeta):
         if alpha_flag not in (0, pygame.RLEACCEL):
             raise ValueError("Wrong value for alpha flag: {}".format(alpha_flag))
         self._alpha_flag = alpha_flag
+        self._unshare()
         self._surface.set_alpha(self.alpha, alpha_flag)
         
     @property
@@ -124,6 +131,7 @@ class Shape (metaclass=ShapeMeta):
         """
         Sets the $color at $point.
         """
+        self._unshare()
         self._surface.set_at(point, color)
 
     @property
@@ -191,6 +199,7 @@ class Shape (metaclass=ShapeMeta):
     def fill (self, color):
         """Fill the Shape surface with a solid $color
         (anything accepted by pygame.Surface.fill)."""
+        self._unshare()
         self._surface.fill(color)
 
     def fit (self, obj):
@@ -232,6 +241,11 @@ class Shape (metaclass=ShapeMeta):
     def rotate (self, angle, anchor_at='center'): #XXX+TODO
         raise NotImplementedError
 
+    def _unshare (self):
+        """Copy the surface if it's a shared one (copy on write)."""
+        if self._surface is self._shared_surface:
+            self._surface = self._surface.copy()
+
     def set_surface(self, surf):
         """Set the $surf Surface as the object surface. """
         center = self._rect.center
@@ -241,6 +255,21 @@ class Shape (metaclass=ShapeMeta):
         self._rect.center = center
         
 
+def _bound_rect (obj):
+    """
+    Returns the pygame.Rect of obj (a pygame.Rect, a pygame.Surface,
+    a Shape or derived object), to be used as a bounding box.
+    Raise TypeError for other objects.
+    """
+    if isinstance(obj, pygame.Rect):
+        return obj
+    elif isinstance(obj, pygame.Surface):
+        return obj.get_rect()
+    elif isinstance(obj, Shape):
+        return obj._rect
+    raise TypeError("Unsupported object to clamp in: <{}>".format(obj))
+
+
 class GameObject(Shape):
     def __init__ (self, obj=None, cmp_value=None):
         """
@@ -265,7 +294,8 @@ class GameObject(Shape):
                 self._cmp_value = id(self)
         elif not isinstance(obj, (pygame.Surface, Shape, types.NoneType)):
             raise TypeError("Can't create an instance from <{}>".format(obj))
-        self._action_groups = defaultdict(list)
+        # created by set_action, most objects never register actions.
+        self._action_groups = None
 
     @property
     def compare_value (self):
@@ -299,14 +329,7 @@ class GameObject(Shape):
         Clamps this object into obj (a pygame.Rect, a pygame.Surface,
         a Shape or derived object) or raise TypeError.
         """
-        if isinstance(obj, pygame.Rect):
-            super().clamp(Shape(obj))
-        elif isinstance(obj, pygame.Surface):
-            super().clamp(Shape(obj.get_rect()))
-        elif isinstance(obj, Shape):
-            super().clamp(obj)
-        else:
-            raise TypeError("Unsupported object to clamp in: <{}>".format(obj))
+        self._rect.clamp_ip(_bound_rect(obj))
 
     def copy (self):
         """Returns a copy of this object."""
@@ -326,18 +349,19 @@ class GameObject(Shape):
         pygame.Surface, a GameObject or a Shape object) by velocity,
         a pair of integer values, or None (in the latter case, the
         object's own velocity is used).
-        """
-        if isinstance(obj, pygame.Surface):
-            obj = obj.get_rect()
-        x, y = velocity if velocity is not None else self.velocity
-        vx, vy = x, y
-        if (self.left + x <= obj.left or self.right + x >= obj.right):
-            vx = -x
-        if (self.bottom + y >= obj.bottom or self.top + y <= obj.top):
-            vy = -y
-        self.move(x, y)
-        self.velocity = (vx, vy)
-        self.clamp(obj)
+        Raise TypeError for unsupported *obj* types.
+        """
+        bound = _bound_rect(obj)
+        x, y = velocity if velocity is not None else self._velocity
+        left, top, w, h = self._rect
+        bleft, btop, bw, bh = bound
+        left += x
+        top += y
+        vx = -x if (left <= bleft or left + w >= bleft + bw) else x
+        vy = -y if (top + h >= btop + bh or top <= btop) else y
+        self._rect.move_ip(x, y)
+        self._velocity = Velocity(vx, vy)
+        self._rect.clamp_ip(bound)
 
     def move_random (self, obj=None, xbound=None, ybound=None):
         """
@@ -349,13 +373,11 @@ class GameObject(Shape):
         used as bounding box, otherwise the object is free to move along
         the plane without limits (even negative ones).
         """
-        if xbound is None:
-            xbound = (0, self.velocity.x)
-        if ybound is None:
-            ybound = (0, self.velocity.y)
-        self.move(random.randint(*xbound), random.randint(*ybound))
+        x0, x1 = (0, self._velocity.x) if xbound is None else xbound
+        y0, y1 = (0, self._velocity.y) if ybound is None else ybound
+        self._rect.move_ip(_randint(x0, x1), _randint(y0, y1))
         if obj is not None:
-            self.clamp(obj)
+            self._rect.clamp_ip(_bound_rect(obj))
 
     def rotate (self, angle, anchor_at=CENTER): #XXX+TODO
         raise NotImplementedError
@@ -364,7 +386,9 @@ class GameObject(Shape):
         """
         Execute the action(s) in group previously set by the set_action method.
         """
-        for func, args, kwords in self._action_groups[group]:
+        if self._action_groups is None:
+            return
+        for func, args, kwords in self._action_groups.get(group, ()):
             func(*args, **kwords)
 
     def set_attrs (self, attrs):
@@ -376,8 +400,13 @@ class GameObject(Shape):
             attrs = tuple(attrs.items())
         except AttributeError:
             pass
+        rect = self._rect
         for attr, value in attrs:
-            setattr(self, attr, value)
+            # rect attributes skip the ShapeMeta properties.
+            if attr in _RECT_ATTRS:
+                setattr(rect, attr, value)
+            else:
+                setattr(self, attr, value)
 
     def set_action (self, callable, args=None, kwords=None, group=None):
         """Set a new action which will be executed by the raise_actions method.
@@ -386,6 +415,8 @@ class GameObject(Shape):
           kwords   => dict of keyword arguments for the callable (optional)
           group    => name of the action-group this action belongs (optional)
         """
+        if self._action_groups is None:
+            self._action_groups = defaultdict(list)
         self._action_groups[group].append((callable, args or (), kwords or {}))
 
     def del_action_group (self, group):
@@ -393,6 +424,8 @@ class GameObject(Shape):
         Delete the actions registered at group and return it (or None
         if the named group doesn't exsist).
         """
+        if self._action_groups is None:
+            return None
         return self._action_groups.pop(group, None)
 
 
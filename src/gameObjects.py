@@ -13,22 +13,81 @@ various type of game objects.
 
 # std imports
 from collections import OrderedDict
+import importlib.util
 import os
 # local imports
-from bumpo.baseObjects import GameObject, Shape, Board
+from bumpo.baseObjects import GameObject, Shape, Board, Velocity, _bound_rect
 from bumpo import gameUtils
 from bumpo.gameUtils import Table
 from bumpo.const import WIDTH, HEIGHT, CENTER
 # external imports
 import pygame
+try:
+    import numpy
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+# numba is slow to import, so it's imported only when needed
+# (see _compiled_bounce_kernel).
+HAVE_NUMBA = HAVE_NUMPY and importlib.util.find_spec('numba') is not None
+
+
+# (file mtime, display format, converted source surface)
+# of the objects loaded from file, by path
+_SOURCE_SURFACES = {}
+_SOURCE_SURFACES_MAX = 64
+# font.size() of the strings rendered by TextImage objects,
+# by (font path, font name, font size, string)
+_TEXT_SIZES = {}
+_TEXT_SIZES_MAX = 1024
+# rotated surfaces cached by each GenericGameObject (see rotate)
+_ROT_CACHE_MAX = 32
+
+
+def _source_surface (filepath):
+    """
+    Returns the (converted) surface loaded from *filepath*.
+    The surface is cached, so that objects made from the same file
+    don't decode it again until the file or the display pixel format
+    changes; it's shared, so copy it before any change.
+    """
+    mtime = os.stat(filepath).st_mtime_ns
+    fmt = _display_format()
+    try:
+        cached_mtime, cached_fmt, surf = _SOURCE_SURFACES[filepath]
+        if cached_mtime == mtime and cached_fmt == fmt:
+            return surf
+    except KeyError:
+        if len(_SOURCE_SURFACES) >= _SOURCE_SURFACES_MAX:
+            _SOURCE_SURFACES.clear()
+    surf = gameUtils.surface_from_file(filepath)
+    _SOURCE_SURFACES[filepath] = mtime, fmt, surf
+    return surf
+
+
+def _display_format ():
+    """
+    Returns the (bitsize, masks) pixel format of the display
+    surface, or None if the display mode isn't set.
+    """
+    screen = pygame.display.get_surface()
+    if screen is None:
+        return None
+    return screen.get_bitsize(), screen.get_masks()
+
+
+def clear_source_cache ():
+    """Forget the surfaces cached for the objects loaded from file."""
+    _SOURCE_SURFACES.clear()
 
 
 class GenericGameObject (GameObject):
-    _reload_on_resize = True
     """
     A generic game object. Provide methods for drawing,
     moving, resizing, comparing game objects, etc.
     """
+    _reload_on_resize = True
+    _rot_surface = None # the surface set by the last rotate
     def __init__ (self, obj=None, cmp_value=None, reload=None):
         """
         XXX+TODO: better doc
@@ -37,14 +96,20 @@ class GenericGameObject (GameObject):
         """
         if isinstance(obj, str):
             self._filepath = obj
-            obj = gameUtils.surface_from_file(obj)
+            obj = _source_surface(obj)
         else:
             self._filepath = None
+        # NOTE: Shape.__init__ already copies and converts the surface.
         super().__init__(obj, cmp_value)
-        self.convert()
+        self._angle = 0
+        self._rot_cache = {} # rotated surfaces, by angle
         if reload is not None:
             self._reload_on_resize = bool(reload)
 
+    def _reload_source (self):
+        """Set the object's surface from the original image file."""
+        self.set_surface(_source_surface(self._filepath))
+
     @property
     def reload (self): 
         """
@@ -62,8 +127,7 @@ class GenericGameObject (GameObject):
         """
         if value and self._filepath:
             size = self.size
-            self.set_surface(gameUtils.surface_from_file(self._filepath))
-            self.convert()
+            self._reload_source()
             self.resize(*size)
         self._reload_on_resize = bool(value)
 
@@ -73,11 +137,15 @@ class GenericGameObject (GameObject):
         or a GameObject. The aspect ratio of the object is preserved, so the
         new size may be smaller than the target in either width or height.
         """
+        if self._is_rotated():
+            rect = self._rect.fit(_bound_rect(obj))
+            self._resize_rotated(*rect.size)
+            self._rect = rect
+            return
         if self._reload_on_resize:
             if obj.w > self.w or obj.h > self.h:
                 if self._filepath:
-                    self.set_surface(gameUtils.surface_from_file(self._filepath))
-                    self.convert()
+                    self._reload_source()
         super().fit(obj)
 
     def resize (self, width, height, anchor=CENTER):
@@ -86,13 +154,18 @@ class GenericGameObject (GameObject):
         anchor (default CENTER) is the object's invariant point
         to be preserved after resizing.
         """ 
-        fp = getattr(self, anchor)
-        if self._reload_on_resize:
-            if width > self.w or height > self.h:
-                if self._filepath:
-                    self.set_surface(gameUtils.surface_from_file(self._filepath))
-                    self.convert()
-        super().resize(width, height)
+        if ((width, height) == self._rect.size
+            and (width, height) == self._surface.get_size()):
+            return
+        fp = getattr(self._rect, anchor)
+        if self._is_rotated():
+            self._resize_rotated(width, height)
+        else:
+            if self._reload_on_resize:
+                if width > self.w or height > self.h:
+                    if self._filepath:
+                        self._reload_source()
+            super().resize(width, height)
         self.move_at(fp, anchor)
 
     def resize_perc_from (self, obj, perc, anchor=CENTER):
@@ -119,13 +192,87 @@ class GenericGameObject (GameObject):
         w, h = gameUtils.scale_from_dim(self.w, self.h, length, dim)
         self.resize(w, h, anchor)
 
-    def _rotate (self, angle, anchor_at='center'):  #XXX+TODO
+    def rotate (self, angle, anchor_at=CENTER):
         """
         Rotate the object's surface by *angle* amount. Could be a float value.
         Negative angle amounts will rotate clockwise. *anchor_at* is the rect
         attribute used for anchor the rotated rect (default to 'center').
+        The surfaces are always rotated from the unrotated one at the
+        total angle, truncated to integer degrees, and the last
+        _ROT_CACHE_MAX rotations are cached.
+        Resizing (resize, fit, etc.) a rotated object scales the
+        unrotated surface too, so the next rotations start from it;
+        any other change of the object's surface (set_surface, etc.)
+        makes the new one the unrotated surface. The object's alpha is
+        kept, other in-place changes (fill, set_at, etc.) are kept only
+        if made while the object isn't rotated, see _unshare.
+        The object's surface after a rotation is shared with the cache
+        (and copied on change by the object's methods), so don't change
+        it through surfref.
+        """
+        if self._rot_surface is not self._surface:
+            self._rot_cache = {0: self.surface}
+            self._angle = 0
+        alpha = self._surface.get_alpha()
+        self._angle = (self._angle + angle) % 360
+        q = int(self._angle)
+        try:
+            surf = self._rot_cache[q]
+        except KeyError:
+            if len(self._rot_cache) >= _ROT_CACHE_MAX:
+                self._rot_cache = {0: self._rot_cache[0]}
+            surf = pygame.transform.rotate(self._rot_cache[0], q)
+            self._rot_cache[q] = surf
+        if surf.get_alpha() != alpha:
+            surf.set_alpha(alpha)
+        point = getattr(self._rect, anchor_at)
+        self._surface = self._shared_surface = self._rot_surface = surf
+        self._rect = surf.get_rect()
+        setattr(self._rect, anchor_at, point)
+
+    def _is_rotated (self):
+        """Returns True if the object's surface is a rotated one."""
+        return (self._surface is self._rot_surface
+                and self._surface is not self._rot_cache.get(0))
+
+    def _resize_rotated (self, width, height):
+        """
+        Resize a rotated object at (width, height) size, scaling
+        the unrotated surface by the same amount (see rotate).
         """
-        raise NotImplementedError
+        w, h = self._rect.size
+        base = self._rot_cache[0]
+        bw, bh = base.get_size()
+        if self._reload_on_resize:
+            if width > w or height > h:
+                if self._filepath:
+                    base = _source_surface(self._filepath)
+        base = gameUtils.surface_resize(
+            base, max(1, bw * width // w if w else width),
+            max(1, bh * height // h if h else height))
+        surf = pygame.transform.rotate(base, int(self._angle))
+        if surf.get_size() != (width, height):
+            surf = gameUtils.surface_resize(surf, width, height)
+        surf.set_alpha(self._surface.get_alpha())
+        self._rot_cache = {0: base, int(self._angle): surf}
+        self._surface = self._shared_surface = self._rot_surface = surf
+        self._rect.size = width, height
+
+    def _unshare (self):
+        """
+        Copy on write of the rotated surfaces (see rotate).
+        Changes to the unrotated surface are made in place and the
+        cached rotations discarded; a rotated surface is copied, so
+        the next rotate still starts from the unrotated one.
+        """
+        if self._surface is not self._rot_surface:
+            super()._unshare()
+        elif self._surface is self._rot_cache.get(0):
+            self._rot_cache = {0: self._surface}
+            self._shared_surface = None
+        elif self._surface is self._shared_surface:
+            super()._unshare()
+            self._rot_surface = self._surface
 
 
 class TextImage (GenericGameObject):
@@ -146,6 +293,7 @@ class TextImage (GenericGameObject):
             self._text = obj
         else:
             self._text = obj.text
+        self._btext = self._text.encode('utf-8') # the text to render
         self._fname = None # set by _set_font_source
         self._fpath = None # set by _set_font_source
         self._set_font_source(fname)
@@ -170,11 +318,16 @@ class TextImage (GenericGameObject):
     def _build_surface (self):
         """Builds and returns the object's surface."""
         if self._bgc is None:
-            return self._font.render(
-                self.text.encode('utf-8'), True, self._fgc)
-        return self._font.render(
-            self.text.encode('utf-8'), True, self._fgc, self._bgc)
+            return self._font.render(self._btext, True, self._fgc)
+        return self._font.render(self._btext, True, self._fgc, self._bgc)
         
+    def _rebuild_surface (self):
+        """Set a new surface for the object, converted for fast blitting
+        (font.render returns surfaces in their own pixel format).
+        """
+        self.set_surface(self._build_surface())
+        self.convert()
+
     def _build_font (self, name_or_font, size):
         """Build the font.
         name_or_font => the name or a font, a path of the font file
@@ -223,11 +376,13 @@ class TextImage (GenericGameObject):
         anchor (default CENTER) is the object's invariant point
         to be preserved after resizing.
         """ 
-        fp = getattr(self, anchor)
-        fw, fh = self._font.size(self.text)
+        if (w, h) == self._rect.size and (w, h) == self._surface.get_size():
+            return
+        fp = getattr(self._rect, anchor)
+        fw, fh = self._text_size(self._text)
         self._fsize = max((self._fsize * h // fh, self._fsize * w // fw))
         self._build_font(self._fname, self._fsize)
-        self.set_surface(self._build_surface())
+        self._rebuild_surface()
         self.move_at(fp, anchor)
 
     def set_text (self, text):
@@ -235,15 +390,37 @@ class TextImage (GenericGameObject):
         Set object's text to the string *text*, then rebuild font and surface.
         """
         self._text = text
+        self._btext = text.encode('utf-8')
         self._build_font(self._fname, self._fsize)
-        self.set_surface(self._build_surface())
+        self._rebuild_surface()
+
+    def _text_size (self, string):
+        """
+        Returns the size of string rendered with the object's font.
+        Sizes are cached across all the objects using the same font.
+        """
+        if self._fpath is None and self._fname is None:
+            # user's font object or default font, can't tell them apart.
+            return self._font.size(string)
+        key = self._fpath, self._fname, self._fsize, string
+        try:
+            return _TEXT_SIZES[key]
+        except KeyError:
+            if len(_TEXT_SIZES) >= _TEXT_SIZES_MAX:
+                _TEXT_SIZES.clear()
+            size = _TEXT_SIZES[key] = self._font.size(string)
+            return size
 
     def size_of (self, string):
         """Returns the size of string rendered using the object's font."""
-        return self._font.size(string)
+        return self._text_size(string)
 
 
 class Grid (object):
+    __slots__ = ('_table', '_board', '_shape', '_resize_func', '_dirty')
+    # over this number of rects, update() asks for a full
+    # display update instead of returning the changed cells rects.
+    _max_dirty_rects = 25
     def __init__ (self, rows, columns, size=(0,0)):
         """Make a Grid object.
         Provides some methods similar to other GameObject(s)
@@ -252,6 +429,7 @@ class Grid (object):
         self._table = Table(rows, columns)
         self._board = Board(size)
         self._shape = Shape(self._board.surfref)
+        self._dirty = None # changed cells positions, None for all
         # default resize callback
         def rf (obj, cell, pos):
             obj.fit(cell)
@@ -275,6 +453,14 @@ class Grid (object):
 
     def __setitem__ (self, item, value):
         self._table[item] = value
+        self._set_dirty(item)
+
+    def _set_dirty (self, pos=None):
+        """Mark the cell at *pos* as changed, or the whole grid if None."""
+        if pos is None:
+            self._dirty = None
+        elif self._dirty is not None:
+            self._dirty.add(pos)
 
     @property
     def dims (self):
@@ -344,13 +530,15 @@ class Grid (object):
         if self.isfull:
             return lst
 
+        empty = self.empty
         for p, v in self.items():
-            if (v == self.empty) or overwrite:
+            if overwrite or v == empty:
                 try:
                     self._table[p] = lst.pop()
+                    self._set_dirty(p)
                 except IndexError:
                     break
-        return list(reversed(lst))
+        return lst[::-1]
 
     def arrange (self, update=True):
         """Arrange the grid's objects.
@@ -359,23 +547,27 @@ class Grid (object):
         """
         w, h = self.size
         cols, rows = self._table.n_cols, self._table.n_rows
-        cell = Shape()
-        cell.resize(w // cols, h // rows)
+        cw, ch = w // cols, h // rows
         left, top = self._shape.topleft
-        for r, c in self._table.iter_pos():
-            cell.move_at((c * cell.w + left, r * cell.h + top), 'topleft')
-            obj = self._table[r, c]
-            if obj != self.empty:
-                obj.move_at(cell.center)
+        # cells centers, computed once per axis
+        xs = [c * cw + left + cw // 2 for c in range(cols)]
+        ys = [r * ch + top + ch // 2 for r in range(rows)]
+        empty = self.empty
+        for (r, c), obj in self._table.items():
+            if obj != empty:
+                obj.move_at((xs[c], ys[r]))
+        self._set_dirty()
         if update:
-            self.update()
+            self._draw()
 
     def move (self, x ,y, update=False):
         self._shape.move(x, y)
+        self._set_dirty()
         self.arrange(update)
 
     def move_at (self, point, anchor=CENTER, update=False):
         self._shape.move_at(point, anchor)
+        self._set_dirty()
         self.arrange(update)
 
     def positions (self, item):
@@ -395,10 +587,11 @@ class Grid (object):
         cols, rows = self._table.n_cols, self._table.n_rows
         cell = Shape()
         cell.resize(w // cols, h // rows)
-        for r, c in self._table.iter_pos():
-            obj = self._table[r, c]
-            if obj != self.empty:
-                resize_func(obj, cell, (r, c))
+        empty = self.empty
+        for pos, obj in self._table.items():
+            if obj != empty:
+                resize_func(obj, cell, pos)
+        self._set_dirty()
         self.arrange(update)
 
     def resize (self, w, h, update=True):
@@ -413,28 +606,201 @@ class Grid (object):
         """Shuffle the grid's cells.
         Update the Grid contents if update is a True value (default).
         """
-        rects = []
-        for obj in self._table.values():
-            if obj != self.empty:
-                rects.append(obj.rect)
+        empty = self.empty
+        centers = [obj.center for obj in self._table.values() if obj != empty]
         self._table.shuffle()
+        self._set_dirty()
         for obj in self._table.values():
-            if obj != self.empty:
-                obj.move_at(rects.pop().center)
+            if obj != empty:
+                obj.move_at(centers.pop())
         if update:
-            self.update()
+            self._draw()
+
+    def _draw (self):
+        """
+        Draw the grid's objects on the board. Unlike update,
+        the changed cells are kept for the next update call.
+        """
+        w, h = self.size
+        rows, cols = self.dims
+        cw, ch = w // cols, h // rows
+        empty = self.empty
+        # a single batched blit, in row-major order (i.e. the drawing
+        # order of overlapping objects doesn't change).
+        self._board.surfref.blits(
+            [(obj.surfref, (c * cw, r * ch))
+             for (r, c), obj in self._table.items() if obj != empty],
+            False)
 
     def update (self):
         """
         Update the grid's board.
+        Returns a list of the (display) rects of the cells changed through
+        the grid's methods since the last update (adjacent changed cells
+        of a row share a single rect), or None if the whole grid area
+        should be updated (too many rects, the grid has been moved,
+        resized, shuffled or arranged, etc.), e.g:
+          rects = grid.update()
+          if rects is None: pygame.display.flip()
+          else: pygame.display.update(rects)
+        The methods redrawing the board by themselves (update=True)
+        don't reset the changed cells, so the next update still
+        returns them.
         """
+        self._draw()
         w, h = self.size
-        rows, cols = self.dims
-        cell = Shape()
-        cell.resize(w // cols, h // rows)
-        for (r, c), obj in self._table.items():
-            if obj != self.empty:
-                self._board.draw(obj, (c * cell.w, r * cell.h))
+        cw, ch = w // self._table.n_cols, h // self._table.n_rows
+        dirty, self._dirty = self._dirty, set()
+        if dirty is None:
+            return None
+        left, top = self._shape.topleft
+        rects = []
+        prev = None
+        for r, c in sorted(dirty):
+            if prev == (r, c - 1):
+                rects[-1].w += cw
+            elif len(rects) == self._max_dirty_rects:
+                return None
+            else:
+                rects.append(pygame.Rect(left + c * cw, top + r * ch, cw, ch))
+            prev = r, c
+        return rects
+
+
+def _bounce_kernel (x, y, w, h, vx, vy, bleft, btop, bw, bh):
+    """
+    Move in place the x, y positions (and the vx, vy velocities) of the
+    objects bouncing inside the (bleft, btop, bw, bh) rect,
+    as GameObject.move_bouncing does for a single object.
+    """
+    bright = bleft + bw
+    bbottom = btop + bh
+    for i in range(x.shape[0]):
+        nx = x[i] + vx[i]
+        ny = y[i] + vy[i]
+        if nx <= bleft or nx + w[i] >= bright:
+            vx[i] = -vx[i]
+        if ny + h[i] >= bbottom or ny <= btop:
+            vy[i] = -vy[i]
+        # clamp, as pygame.Rect.clamp_ip
+        if w[i] >= bw:
+            nx = bleft + bw // 2 - w[i] // 2
+        elif nx < bleft:
+            nx = bleft
+        elif nx + w[i] > bright:
+            nx = bright - w[i]
+        if h[i] >= bh:
+            ny = btop + bh // 2 - h[i] // 2
+        elif ny < btop:
+            ny = btop
+        elif ny + h[i] > bbottom:
+            ny = bbottom - h[i]
+        x[i] = nx
+        y[i] = ny
+
+_compiled_kernel = None
+
+def _compiled_bounce_kernel ():
+    """Returns _bounce_kernel compiled by numba, imported at the first call."""
+    global _compiled_kernel
+    if _compiled_kernel is None:
+        import numba
+        _compiled_kernel = numba.njit(cache=True)(_bounce_kernel)
+    return _compiled_kernel
+
+
+class BatchMover (object):
+    """
+    Move many game objects at once.
+    If numpy is available, positions, sizes and velocities of the objects
+    are read once and kept as arrays inside the mover, which moves them
+    as whole arrays (move_bouncing uses a compiled loop if numba is
+    available too; numba is imported and the loop loaded by its first
+    call, which takes a while). The objects themselves are changed only
+    by the sync method; call load after changing them from outside
+    the mover.
+    Without numpy each object is moved by its own methods, and sync
+    and load do nothing.
+    """
+    def __init__ (self, objects):
+        """objects => a sequence of GameObject (or derived) objects."""
+        self._objects = list(objects)
+        self._arrays = None # x, y, w, h, vx, vy of the objects
+        self.load()
+
+    @property
+    def objects (self):
+        """Returns the moved objects."""
+        return tuple(self._objects)
+
+    def load (self):
+        """Read the positions, sizes and velocities of the objects."""
+        if HAVE_NUMPY and self._objects:
+            self._arrays = numpy.ascontiguousarray(numpy.array(
+                [tuple(o._rect) + tuple(o._velocity) for o in self._objects],
+                dtype=numpy.int64).T)
+
+    def sync (self):
+        """Set the objects positions and velocities from the mover."""
+        if self._arrays is None:
+            return
+        x, y, w, h, vx, vy = self._arrays.tolist()
+        for o, px, py, pvx, pvy in zip(self._objects, x, y, vx, vy):
+            o._rect.topleft = px, py
+            o._velocity = Velocity(pvx, pvy)
+
+    @staticmethod
+    def _clamp (pos, length, bpos, blength):
+        """Clamp in place positions along one axis, as pygame.Rect.clamp_ip."""
+        numpy.clip(pos, bpos, bpos + blength - length, out=pos)
+        big = length >= blength
+        pos[big] = bpos + blength // 2 - length[big] // 2
+
+    def move_bouncing (self, obj):
+        """
+        Move all the objects bouncing inside *obj* (either a pygame.Rect,
+        a pygame.Surface, a GameObject or a Shape object) by their own
+        velocity. Same as calling the move_bouncing method of each object
+        (then sync, if using numpy).
+        Raise TypeError for unsupported *obj* types.
+        """
+        if self._arrays is None:
+            for o in self._objects:
+                o.move_bouncing(obj)
+            return
+        bleft, btop, bw, bh = _bound_rect(obj)
+        x, y, w, h, vx, vy = self._arrays
+        if HAVE_NUMBA:
+            _compiled_bounce_kernel()(x, y, w, h, vx, vy, bleft, btop, bw, bh)
+            return
+        x += vx
+        y += vy
+        numpy.negative(vx, out=vx, where=(x <= bleft) | (x + w >= bleft + bw))
+        numpy.negative(vy, out=vy, where=(y + h >= btop + bh) | (y <= btop))
+        self._clamp(x, w, bleft, bw)
+        self._clamp(y, h, btop, bh)
+
+    def move_random (self, obj=None, xbound=None, ybound=None):
+        """
+        Move all the objects in a new pseudo-random position.
+        Same as calling the move_random method of each object (see its
+        doc for the arguments, then sync if using numpy), but with numpy
+        the random values are drawn all at once from numpy.random.
+        """
+        if self._arrays is None:
+            for o in self._objects:
+                o.move_random(obj, xbound, ybound)
+            return
+        x, y, w, h, vx, vy = self._arrays
+        x0, x1 = (0, vx) if xbound is None else xbound
+        y0, y1 = (0, vy) if ybound is None else ybound
+        n = len(self._objects)
+        x += numpy.random.randint(x0, numpy.add(x1, 1), n)
+        y += numpy.random.randint(y0, numpy.add(y1, 1), n)
+        if obj is not None:
+            bleft, btop, bw, bh = _bound_rect(obj)
+            self._clamp(x, w, bleft, bw)
+            self._clamp(y, h, btop, bh)
 
 
 ''' #XXX+TODO: ??? don't remember for which this is for  xD
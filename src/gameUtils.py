@@ -27,10 +27,23 @@ class CopyValue:
 #############
 
 def check_collisions(objs, r):
+    """
+    For each object in *objs*, call its move_bouncing(*r*) method once
+    for every following object it collides with.
+    """
+    # an object moves only after the previous ones have been checked,
+    # so the following objects' rects are taken once.
+    rects = [o.rect for o in objs]
     for i, o1 in enumerate(objs):
-        for o2 in objs[i+1:]:
-            if o1.rect.colliderect(o2):
-                o1.move_bouncing(r)
+        rect = rects[i]
+        start = i + 1
+        while True:
+            j = rect.collidelist(rects[start:])
+            if j < 0:
+                break
+            o1.move_bouncing(r)
+            rect = o1.rect
+            start += j + 1
 
 
 def convert (surface, obj=None, alpha=True):
@@ -64,6 +77,14 @@ def convert (surface, obj=None, alpha=True):
 
 def edistance (seq1, seq2):
     """Returns the Euclidean distance between *seq1* and *seq2*."""
+    try:
+        if len(seq1) == len(seq2):
+            return math.dist(seq1, seq2)
+    except TypeError:
+        # iterables without len(), or coordinates math.dist
+        # can't handle: use the generic code below.
+        pass
+    # the extra coordinates of the longer sequence are ignored
     return sum((c1 - c2) ** 2 for c1, c2 in zip(seq1, seq2)) ** .5
 
 
@@ -84,9 +105,8 @@ def finddiv (n):
     """
     if n <= 0:
         return (1, 1)
-    c = int(math.ceil(n ** .5))
-    d, m = divmod(n, c)
-    return c, d + (1 if m else 0)
+    c = math.isqrt(n - 1) + 1 # ceil(sqrt(n)), in integer arithmetic
+    return c, -(-n // c)
 
 
 def relative_point (p1, p2, size):
@@ -175,10 +195,14 @@ class FakeSound: #XXX+TODO: maybe useless. Wraps Channels and Sound object in an
     def __init__ (self, path_or_fileobj, channel=None):
         self.target = path_or_fileobj
         self.channel = channel
+        self._length = None # (target, length) of the last get_length call
 
     def get_length (self):
         """Return the length of the FakeSound (in seconds)."""
-        return pygame.mixer.Sound(self.target).get_length()
+        if self._length is None or self._length[0] is not self.target:
+            length = pygame.mixer.Sound(self.target).get_length()
+            self._length = self.target, length
+        return self._length[1]
 
     def play (self, channel=0):
         """Begin sound playback, returns a Channel object."""
@@ -197,14 +221,19 @@ class FakeSound: #XXX+TODO: maybe useless. Wraps Channels and Sound object in an
 
 class EmptyObject:
     """Table default empty object."""
+    __slots__ = ()
     def __eq__ (self, other):
-        return self.__class__.__name__ == other
+        return other is self or self.__class__.__name__ == other
     def __ne__ (self, other):
         return not (self == other)
     def __str__ (self):
         return ''
 
+# (row, column) coordinates of the Table cells, by table size
+_TABLE_POSITIONS = {}
+
 class Table:
+    __slots__ = ('_row', '_col', '_empty', '_grid', '_n_empty', '_positions')
     def __init__ (self, rows, columns, empty=EmptyObject(), seq=()):
         """
         Create a Table of *row* x *columns* size.
@@ -216,17 +245,26 @@ class Table:
         self._row = rows
         self._col = columns
         self._empty = empty
-        self._grid = dict(
-            it.takewhile(lambda args: args[0] != empty,
-                         it.zip_longest(
-                             self.iter_pos(), seq, fillvalue=empty)))
+        # cells values, row by row: (row, col) is at row * columns + col
+        self._grid = list(it.islice(it.chain(seq, it.repeat(empty)),
+                                    rows * columns))
+        # number of empty cells (compared as the `in` operator does)
+        self._n_empty = self._grid.count(empty)
+        # shared by all the tables of the same size
+        try:
+            self._positions = _TABLE_POSITIONS[rows, columns]
+        except KeyError:
+            self._positions = _TABLE_POSITIONS[rows, columns] = tuple(
+                it.product(range(rows), range(columns)))
 
     def __contains__ (self, item):
-        return item in self._grid.values()
+        return item in self._grid
 
     def __eq__ (self, other):
         if self.size != other.size:
             return False
+        if isinstance(other, Table):
+            return self._grid == other._grid
         try:
             for pos, value in self.items():
                 if other[pos] != value:
@@ -239,16 +277,31 @@ class Table:
         return not (self == other)
 
     def __getitem__(self, item):
-        return self._grid[item]
+        row, col = item
+        if 0 <= row < self._row and 0 <= col < self._col:
+            return self._grid[row * self._col + col]
+        raise KeyError(item)
 
     def __setitem__ (self, item, value):
-        self._grid[item] = value
+        row, col = item
+        if not (0 <= row < self._row and 0 <= col < self._col):
+            raise KeyError(item)
+        idx = row * self._col + col
+        empty = self._empty
+        old = self._grid[idx]
+        self._grid[idx] = value
+        was_empty = old is empty or old == empty
+        is_empty = value is empty or value == empty
+        if was_empty and not is_empty:
+            self._n_empty -= 1
+        elif is_empty and not was_empty:
+            self._n_empty += 1
 
     def __iter__(self):
-        return iter(self._grid[pos] for pos in self.iter_pos())
+        return iter(self._grid)
 
     def __len__ (self):
-        return len(self._grid)
+        return self._row * self._col
 
     def __str__ (self):
         return "Table object ({}, {}) at {}".format(
@@ -262,23 +315,18 @@ class Table:
     @property
     def isfull (self):
         """Return True if the table has been completely filled."""
-        return self.empty not in self
+        return not self._n_empty
 
     @property
     def columns (self):
         """The table's columns, as a list of lists."""
-        cols = []
-        for col in range(self._col):
-            cols.append(list(self[row, col] for row in range(self._row)))
-        return cols
+        return [self._grid[col::self._col] for col in range(self._col)]
 
     @property
     def rows (self):
         """The table's rows, as a list of lists."""
-        rows = []
-        for row in range(self._row):
-            rows.append(list(self[row, col] for col in range(self._col)))
-        return rows
+        c = self._col
+        return [self._grid[r * c:(r + 1) * c] for r in range(self._row)]
 
     @property
     def n_cols (self):
@@ -297,10 +345,7 @@ class Table:
 
     def copy (self):
         """Returns a copy of the table."""
-        new_table = Table(self._row, self._col, self.empty)
-        for pos, value in self.items():
-            new_table[pos] = value
-        return new_table
+        return Table(self._row, self._col, self.empty, self)
 
     def diagonal (self, row=0, col=0, topright=False):
         """
@@ -310,12 +355,19 @@ class Table:
         If *topright* is True, return the topright-to-bottomleft diagonal.
         Raise KeyError for *row* or *col* values out of index.
         """
-        values = []
-        endcol = (self._col, -1)[topright]
-        stepcol = (1, -1)[topright]
-        for pos in zip(range(row, self._row), range(col, endcol, stepcol)):
-            values.append(self[pos])
-        return values
+        if topright:
+            length = min(self._row - row, col + 1)
+            step = self._col - 1
+        else:
+            length = min(self._row - row, self._col - col)
+            step = self._col + 1
+        if length <= 0:
+            return []
+        if not (0 <= row < self._row and 0 <= col < self._col):
+            raise KeyError((row, col))
+        # a slice of the flat store (step is 0 only for a single value).
+        start = row * self._col + col
+        return self._grid[start:start + (length - 1) * step + 1:step or 1]
 
     def free (self):
         """Yields the table's empty positions."""
@@ -331,14 +383,11 @@ class Table:
 
     def items (self):
         """Yields pairs of ((row, col), value) for each cell in the table."""
-        for pos in self.iter_pos():
-            yield pos, self[pos]
+        yield from zip(self._positions, self._grid)
 
     def iter_pos (self):
         """Yields the coordinates (row, column) of each cell in the table."""
-        for row in range(self._row):
-            for col in range(self._col):
-                yield row, col
+        return iter(self._positions)
 
     def major_diagonal (self):
         """Returns the values on the table's major (or main) diagonal.""" 
@@ -346,10 +395,7 @@ class Table:
 
     def minor_diagonal (self):
         """Returns the values on the table's minor diagonal.""" 
-        values = []
-        for pos in zip(range(self._row), range(self._col-1, -1, -1)):
-            values.append(self[pos])
-        return values
+        return self.diagonal(0, self._col - 1, topright=True)
 
     def pprint (self, fmt=None):
         """Pretty print row-by-row using *fmt* or the default one."""
@@ -359,34 +405,28 @@ class Table:
 
     def reflected_h (self):
         """Returns a (horizontal) reflected _copy_ of the table."""
-        seq = it.chain(*list(x[::-1] for x in self.rows))
+        seq = it.chain.from_iterable(row[::-1] for row in self.rows)
         return Table(self._row, self._col, empty=self.empty, seq=seq)
 
     def reflected_v (self):
         """Returns a (vertical) reflected _copy_ of the table."""
-        seq = it.chain(*self.rows[::-1])
+        seq = it.chain.from_iterable(self.rows[::-1])
         return Table(self._row, self._col, empty=self.empty, seq=seq)
 
     def rotated (self):
         """Returns a rotated _copy_ of the table."""
-        seq = it.chain(*list(x[::-1] for x in zip(*self.rows)))
+        seq = it.chain.from_iterable(col[::-1] for col in self.columns)
         return Table(self._col, self._row, empty=self.empty, seq=seq)
 
     def shuffle (self):
-        cells = list(x for x in self)
-        random.shuffle(cells)
-        for pos in self.iter_pos():
-            self[pos] = cells.pop()
-        assert not cells
+        """Shuffle (in place) the table's values."""
+        random.shuffle(self._grid)
 
     def transposed (self):
         """Returns a transposed _copy_ of the table."""
-        new = Table(self._col, self._row, empty=self.empty)
-        for pos, val in zip(new.iter_pos(), it.chain(*self.columns)):
-            new[pos] = val
-        return new
+        seq = it.chain.from_iterable(self.columns)
+        return Table(self._col, self._row, empty=self.empty, seq=seq)
 
     def values (self):
         """Yields the value of each cell in the table."""
-        for pos in self.iter_pos():
-            yield self[pos]
+        yield from self._grid
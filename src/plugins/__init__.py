@@ -46,27 +46,30 @@ def get_module (module, paths=None):
     """
     # importlib mess... o.O
     if HAVE_IMPORTLIB:
+        if module == '__init__':
+            return None
         for path in list(paths or sys.path):
-            for p in find_plugins(path):
-                spec = importlib.util.spec_from_file_location(module, p)
-                if spec is not None:
-                    mod = importlib.util.module_from_spec(spec)
-                    if mod is not None:
-                        sys.modules[module] = mod
-                        spec.loader.exec_module(mod)
-                        return mod
+            # only the module's own file, see find_plugins.
+            p = os.path.join(path, module + '.py')
+            if not os.path.isfile(p):
+                continue
+            spec = importlib.util.spec_from_file_location(module, p)
+            if spec is not None:
+                mod = importlib.util.module_from_spec(spec)
+                if mod is not None:
+                    sys.modules[module] = mod
+                    spec.loader.exec_module(mod)
+                    return mod
     else:
         file, path, descr = imp.find_module(module, paths)
         return imp.load_module(module, file, path, descr)
 
 
 def find_plugins (path=None):
-    import fnmatch
     if path is None:
         path = os.path.dirname(__file__)
-    modules = [p for p in glob.glob(os.path.join(path, '*.py'))
-               if not fnmatch.fnmatch(p, '*/__init__.py')]
-    return tuple(modules)
+    return tuple(p for p in glob.iglob(os.path.join(path, '*.py'))
+                 if os.path.basename(p) != '__init__.py')
 
 
 def find_plugin_modules (path=None):
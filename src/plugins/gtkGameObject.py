@@ -5,10 +5,6 @@
 # See the file COPYING in the root directory of this package.
 
 
-# std imports
-from io import StringIO
-import tempfile
-
 # local imports
 from bumpo.baseObjects import GameObject
 from bumpo.const import WIDTH, HEIGHT, CENTER
@@ -30,23 +26,22 @@ except ImportError:
     from gi.repository import GdkPixbuf
     GTK_VERSION = 3
 
-class ImgBuffer (object):
+def surface_from_pixbuf (pixbuf):
     """
-    Helper class to be used as a callback for store data
-    generated from some gtk.gdk.pixbuf* functions.
+    Return a pygame.Surface object with the pixels of *pixbuf*
+    (a gtk2 or GdkPixbuf pixbuf, 8 bits per sample).
     """
-    def __init__(self):
-        self.data = []
-    def __call__(self, data, **kw):
-        self.data.append(data)
-        return True
-    def clear (self):
-        """Clear the data cache."""
-        self.data = []
-    def get_data(self):
-        """Returns the data read until now."""
-        return ''.join(self.data)
-
+    w, h = pixbuf.get_width(), pixbuf.get_height()
+    rowlen = w * pixbuf.get_n_channels()
+    stride = pixbuf.get_rowstride()
+    data = pixbuf.get_pixels()
+    if stride != rowlen:
+        # rows are padded, keep only the pixels.
+        data = b''.join(data[r * stride:r * stride + rowlen]
+                        for r in range(h))
+    fmt = 'RGBA' if pixbuf.get_has_alpha() else 'RGB'
+    # copy, so the surface doesn't depend on the data buffer.
+    return pygame.image.frombuffer(data, (w, h), fmt).copy()
 
 def surface_from_file__gtk2 (filepath, size=None):
     """
@@ -60,10 +55,7 @@ def surface_from_file__gtk2 (filepath, size=None):
         pixbuf = gtk.gdk.pixbuf_new_from_file(filepath)
     else:
         pixbuf = gtk.gdk.pixbuf_new_from_file_at_size(filepath, *size)
-    buff = ImgBuffer()
-    pixbuf.save_to_callback(buff, 'png')
-    stream = StringIO(buff.get_data())
-    return pygame.image.load(stream, 'spam.png')
+    return surface_from_pixbuf(pixbuf)
 
 def surface_from_file__gtk3 (filepath, size=None):
     """
@@ -75,17 +67,9 @@ def surface_from_file__gtk3 (filepath, size=None):
     """
     if size is None:
         pixbuf = GdkPixbuf.Pixbuf.new_from_file(filepath)
-        size = pixbuf.get_width(), pixbuf.get_height()
     else:
         pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(filepath, *size)
-    with tempfile.NamedTemporaryFile(delete=False) as t:
-        outf = t.name
-    # XXX+NOTE: actually need this shit because
-    # the other methods (save_to_callback, etc) doesn't works
-    # or not exists at all.
-    pixbuf.savev(outf, 'png', (), ())
-    with open(outf) as _:
-        return pygame.image.load(_, 'spam.png')
+    return surface_from_pixbuf(pixbuf)
 
 
 if GTK_VERSION == 2:
@@ -162,7 +146,10 @@ class GtkGameObject (GameObject):
         anchor (default CENTER) is the object's invariant point
         to be preserved after resizing.
         """ 
-        fp = getattr(self, anchor)
+        if ((width, height) == self._rect.size
+            and (width, height) == self._surface.get_size()):
+            return
+        fp = getattr(self._rect, anchor)
         if self._reload_on_resize:
             if width > self.w or height > self.h:
                 if self._filepath:
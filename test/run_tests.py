@@ -5,7 +5,7 @@
 # See the file COPYING.txt in the root directory of this package.
 
 
-import re
+import glob
 import os
 import sys
 import os.path as op_
@@ -18,9 +18,8 @@ if __name__ == '__main__':
     basepackdir = op_.join(op_.split(pwd)[0], 'src')
     sys.path.insert(0, basepackdir)
 
-    reg = re.compile(r'^test_.*\.py$')
     tests_suite = unittest.TestSuite()
-    for testfile in filter(reg.match,  os.listdir(os.getcwd())):
+    for testfile in sorted(glob.glob('test_*.py')):
         print("### importing module %s ###" % testfile)
         module = __import__(os.path.splitext(testfile)[0])
         tests_suite.addTests(module.load_tests())
@@ -6,7 +6,6 @@
 
 
 # std imports
-import glob
 import itertools as it
 import operator
 import os
@@ -14,6 +13,7 @@ import os.path as op_
 from random import randint, choice
 import string
 import sys
+import tempfile
 import unittest
 # external imports
 import pygame
@@ -63,6 +63,13 @@ SOUNDS_PATH = op_.join(pwd, 'data', 'sounds')
 _DEF_FONT = op_.join(FONTS_PATH, 'FreeSans.otf')
 _DEF_FONT_SIZE = 20
 
+# shorter sweeps for the slowest tests, set BUMPO_FULL=1
+# in the environment to run them all.
+FULL_TESTS = bool(os.environ.get('BUMPO_FULL'))
+N_SIZES = 50 if FULL_TESTS else 10
+PERCS = range(10, 200, 10) if FULL_TESTS else range(10, 200, 40)
+FONT_SIZES = range(5, 50) if FULL_TESTS else range(5, 50, 10)
+
 CLSS = [baseObjects.GameObject, gameObjects.GenericGameObject]
 if HAVE_GTK:
     CLSS.append(gtkGameObject.GtkGameObject)
@@ -75,6 +82,27 @@ def img_cls_reg ():
         baseObjects.Image.register(gtkGameObject.GtkGameObject)
 
 
+def list_files (dirpath):
+    """Returns the paths of the regular files in dirpath."""
+    with os.scandir(op_.realpath(dirpath)) as entries:
+        return sorted(e.path for e in entries if e.is_file())
+
+
+def same_pixels (s1, s2, fmt='RGB'):
+    """
+    Returns True if the surfaces s1 and s2 have the same pixels
+    in the pygame.image.tostring *fmt* format. Surfaces with the same
+    pixel format are compared by their raw buffers, without conversion.
+    """
+    if (s1.get_size() == s2.get_size()
+            and s1.get_bitsize() == s2.get_bitsize()
+            and s1.get_masks() == s2.get_masks()
+            and s1.get_pitch() == s2.get_pitch()
+            and s1.get_buffer().raw == s2.get_buffer().raw):
+        return True
+    return pygame.image.tostring(s1, fmt) == pygame.image.tostring(s2, fmt)
+
+
 def get_random_color ():
     return tuple(randint(0,255) for _ in 'rgba')
 
@@ -116,11 +144,9 @@ class TestShape (unittest.TestCase):
         surf.fill(pygame.Color(*c))
         shape = baseObjects.Shape(surf)
         shape.move_at((randint(-1000,1000),randint(-1000,1000)))
-        self.assertEqual(pygame.image.tostring(surf, 'RGBA'),
-                         pygame.image.tostring(shape.surface, 'RGBA'))
+        self.assertTrue(same_pixels(surf, shape.surface, 'RGBA'))
         copy = shape.copy()
-        self.assertEqual(pygame.image.tostring(copy.surface, 'RGBA'),
-                         pygame.image.tostring(shape.surface, 'RGBA'))
+        self.assertTrue(same_pixels(copy.surface, shape.surface, 'RGBA'))
         self.assertEqual(copy.rect, shape.rect)
         for p in (choice(list(zip(range(shape.w), range(shape.h))))
                   for _ in range(10)):
@@ -167,14 +193,20 @@ class TestGameObjects (unittest.TestCase):
                  'm=': (lambda o:o.move, (2,-2))}
         obj = clsobj(
             baseObjects.Shape(pygame.Surface((100,100))))
+        # no actions set yet
+        topleft = obj.rect.topleft
+        for a in _acts:
+            obj.raise_actions(a)
+            self.assertEqual(obj.del_action_group(a), None)
+        self.assertEqual(obj.topleft, topleft)
         for name, (func, args) in _acts.items():
             obj.set_action(func(obj), args, group=name)
-        topleft = obj.rect.topleft
+        x, y = obj.rect.topleft
         for i in range(10):
-            for a in _acts:
+            for a, (_, (dx, dy)) in _acts.items():
                 obj.raise_actions(a)
-                topleft = tuple(map(sum, zip(topleft, _acts[a][1])))
-                self.assertEqual(obj.topleft, topleft)
+                x, y = x + dx, y + dy
+                self.assertEqual(obj.topleft, (x, y))
         acts = dict(_acts)
         for name, (f, args) in acts.items():
             self.assertEqual(obj.del_action_group(name), [(f(obj), args, {})])
@@ -213,6 +245,16 @@ class TestGameObjects (unittest.TestCase):
             v = tuple(randint(-100,100) for _ in 'xy')
             obj.velocity = v
             self.assertEqual(obj.velocity, v)
+        # set_attrs
+        for _ in range(10):
+            obj = clsobj()
+            attrs = {choice(ANCHORS): (randint(-100,100), randint(-100,100)),
+                     'velocity': (randint(-100,100), randint(-100,100)),
+                     'compare_value': randint(0,100)}
+            for a in (attrs, list(attrs.items())):
+                obj.set_attrs(a)
+                for attr, value in attrs.items():
+                    self.assertEqual(getattr(obj, attr), value)
 
     def testMoving (self):
         for c in CLSS:
@@ -241,6 +283,68 @@ class TestGameObjects (unittest.TestCase):
             self.assertTrue(x in range(xbound[0]+oldx, xbound[1]+oldx+1))
             self.assertTrue(y in range(ybound[0]+oldy, ybound[1]+oldy+1))
 
+    def testBatchMover (self):
+        have_numpy = gameObjects.HAVE_NUMPY
+        have_numba = gameObjects.HAVE_NUMBA
+        try:
+            for flags in set(((have_numpy, have_numba), (have_numpy, False),
+                              (False, False))):
+                gameObjects.HAVE_NUMPY, gameObjects.HAVE_NUMBA = flags
+                for c in CLSS:
+                    self._testBatchMover(c)
+        finally:
+            gameObjects.HAVE_NUMPY = have_numpy
+            gameObjects.HAVE_NUMBA = have_numba
+
+    def _testBatchMover (self, c):
+        objs = []
+        for _ in range(100):
+            obj = c(pygame.Surface((randint(1,200), randint(1,200))))
+            obj.move(randint(-100,500), randint(-100,500))
+            obj.velocity = (randint(-50,50), randint(-50,50))
+            objs.append(obj)
+        copies = [o.copy() for o in objs]
+        mover = gameObjects.BatchMover(objs)
+        self.assertEqual(mover.objects, tuple(objs))
+        for bound in (pygame.Rect(0, 0, 400, 300), pygame.Surface((100,150)),
+                      baseObjects.Shape(pygame.Rect(10, 20, 300, 400))):
+            for _ in range(10):
+                mover.move_bouncing(bound)
+                for o in copies:
+                    o.move_bouncing(bound)
+                mover.sync()
+                for o1, o2 in zip(objs, copies):
+                    self.assertEqual(o1.rect, o2.rect)
+                    self.assertEqual(o1.velocity, o2.velocity)
+        self.assertRaises(TypeError, mover.move_bouncing, 'spam')
+        # with numpy, the objects are changed only by sync
+        old = [o.rect for o in objs]
+        mover.move_bouncing(bound)
+        for o in copies:
+            o.move_bouncing(bound)
+        if gameObjects.HAVE_NUMPY:
+            self.assertEqual([o.rect for o in objs], old)
+        mover.sync()
+        self.assertEqual([o.rect for o in objs], [o.rect for o in copies])
+        # move_random, after changing the objects
+        for o in objs:
+            o.velocity = (randint(0,50), randint(0,50))
+        mover.load()
+        for xbound, ybound in ((None, None), ((-10, 10), (5, 50))):
+            old = [o.topleft for o in objs]
+            mover.move_random(None, xbound, ybound)
+            mover.sync()
+            for o, (x, y) in zip(objs, old):
+                xb = (0, o.velocity.x) if xbound is None else xbound
+                yb = (0, o.velocity.y) if ybound is None else ybound
+                self.assertTrue(x + xb[0] <= o.x <= x + xb[1])
+                self.assertTrue(y + yb[0] <= o.y <= y + yb[1])
+        bound = baseObjects.Shape(pygame.Rect(0, 0, 1000, 1000))
+        mover.move_random(bound, (-100, 100), (-100, 100))
+        mover.sync()
+        for o in objs:
+            self.assertTrue(bound.contains(o))
+
     def testCopy (self):
         for c in CLSS:
             shape = baseObjects.Shape()
@@ -280,9 +384,16 @@ class TestGameObjects (unittest.TestCase):
             obj = clsobj(arg)
             fitshape = baseObjects.Shape()
             clampshape = baseObjects.Shape()
-            for size in ((randint(1,900), randint(1,500)) for _ in range(50)):
+            for size in ((randint(1,900), randint(1,500))
+                         for _ in range(N_SIZES)):
                 # resize
                 obj.resize(*size)
+                if isinstance(obj, gameObjects.GenericGameObject):
+                    # same size, nothing to do
+                    surf, rect = obj.surfref, obj.rect
+                    obj.resize(*size)
+                    self.assertIs(obj.surfref, surf)
+                    self.assertEqual(obj.rect, rect)
                 self.assertEqual(obj.size, size)
                 # clamp
                 clampshape.resize(*size)
@@ -306,7 +417,7 @@ class TestGameObjects (unittest.TestCase):
             for anchor in ANCHORS:
                 w, h = 400, 500
                 # scale_perc
-                for p in range(10, 200, 10):
+                for p in PERCS:
                     obj.resize(w, h)
                     old_anchor = getattr(obj, anchor)
                     obj.scale_perc(p, anchor)
@@ -349,6 +460,79 @@ class TestGameObjects (unittest.TestCase):
                         self.assertEqual(getattr(obj, anchor), old_anchor)
                         obj.resize(w, h)
 
+    def testRotate (self):
+        tostring = pygame.image.tostring
+        for _ in range(10):
+            surf = pygame.Surface((randint(1,100), randint(1,100)))
+            surf.fill((0, 0, 0))
+            surf.set_at((0, 0), (255, 255, 255))
+            obj = gameObjects.GenericGameObject(surf)
+            base = obj.surface
+            orig = tostring(base, 'RGBA')
+            w, h = obj.size
+            for anchor in (choice(ANCHORS) for _ in range(4)):
+                point = getattr(obj, anchor)
+                obj.rotate(90, anchor)
+                self.assertEqual(obj.size, (h, w))
+                self.assertEqual(getattr(obj, anchor), point)
+                w, h = obj.size
+            self.assertEqual(tostring(obj.surface, 'RGBA'), orig)
+            # copy on write of the cached surfaces
+            obj.rotate(90)
+            rotated = tostring(obj.surface, 'RGBA')
+            obj.rotate(270)
+            obj.fill((1, 2, 3))
+            obj.rotate(90)
+            self.assertNotEqual(tostring(obj.surface, 'RGBA'), rotated)
+            obj.rotate(-90)
+            obj.set_surface(base)
+            obj.rotate(90)
+            self.assertEqual(tostring(obj.surface, 'RGBA'), rotated)
+            for angle in range(1, 720, 7):
+                obj.rotate(-angle)
+            obj.resize(w * 2, h * 2)
+            obj.rotate(360)
+            self.assertEqual(obj.size, (w * 2, h * 2))
+        # in-place changes of a rotated object don't change its base
+        obj = gameObjects.GenericGameObject(pygame.Surface((50, 50)))
+        sizes = ((50, 50),
+                 pygame.transform.rotate(pygame.Surface((50, 50)), 30).get_size())
+        for a in range(24):
+            obj.rotate(30)
+            obj.alpha = 255 - a
+            obj.fill((a, a, a))
+            self.assertIn(obj.size, sizes)
+            self.assertEqual(obj.alpha, 255 - a)
+        self.assertEqual(obj.size, (50, 50))
+        obj.rotate(30)
+        self.assertEqual(obj.alpha, 255 - a)
+        # ...and are lost on the next rotate
+        surf = pygame.Surface((50, 50))
+        surf.fill((0, 0, 0))
+        obj = gameObjects.GenericGameObject(surf)
+        obj.rotate(90)
+        obj.fill((255, 255, 255))
+        obj.rotate(-90)
+        self.assertTrue(same_pixels(obj.surface, surf))
+        # resizing a rotated object scales its unrotated surface too
+        obj = gameObjects.GenericGameObject(pygame.Surface((50, 50)))
+        for _ in range(10):
+            obj.rotate(30)
+            obj.resize(*(x * 2 for x in obj.size))
+            obj.resize(*(x // 2 for x in obj.size))
+        obj.rotate(-300)
+        self.assertEqual(obj.size, (50, 50))
+        obj.rotate(45)
+        obj.fit(pygame.Rect(0, 0, 20, 20))
+        self.assertEqual(obj.size, (20, 20))
+        obj.rotate(-45)
+        self.assertTrue(all(x <= 20 for x in obj.size))
+        # at most _ROT_CACHE_MAX rotations cached
+        for _ in range(360):
+            obj.rotate(1)
+        self.assertLessEqual(len(obj._rot_cache),
+                             gameObjects._ROT_CACHE_MAX)
+
     def testClick (self):
         for c in CLSS:
             obj = c()
@@ -393,10 +577,7 @@ class TestFromImageFiles(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         img_cls_reg()
-
-    def setUp(self):
-        self.images_path = filter(op_.isfile,
-            glob.glob(op_.join(op_.realpath(IMAGES_PATH), '*')))
+        cls.images_path = list_files(IMAGES_PATH)
 
     def testLoadImage(self):
         objects1 = []
@@ -410,8 +591,7 @@ class TestFromImageFiles(unittest.TestCase):
             self.assertEqual(obj1.rect, obj2.rect)
             self.assertEqual(obj1.size, obj2.size)
             self.assertEqual(obj1.area, obj2.area)
-            self.assertEqual(pygame.image.tostring(obj1.surface, "RGB"),
-                             pygame.image.tostring(obj2.surface, "RGB"))
+            self.assertTrue(same_pixels(obj1.surface, obj2.surface))
             s1, s2 = obj1.surface, obj2.surface
             for attr in ('get_flags', 'get_bitsize', 'get_bytesize',
                          'get_pitch', 'get_masks', 'get_shifts', 'get_losses'):
@@ -432,6 +612,38 @@ class TestFromImageFiles(unittest.TestCase):
             self.assertEqual(obj1.area, obj2.area)
             self.assertEqual(obj1.size, obj2.size)
 
+    def testSourceCache(self):
+        GGO = gameObjects.GenericGameObject
+        cache = gameObjects._SOURCE_SURFACES
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = op_.join(tmpdir, 'img.bmp')
+            surf = pygame.Surface((4, 4))
+            surf.fill((255, 0, 0))
+            pygame.image.save(surf, path)
+            self.assertEqual(GGO(path).at((0, 0)), (255, 0, 0))
+            self.assertIn(path, cache)
+            # changed file, reloaded
+            surf.fill((0, 255, 0))
+            pygame.image.save(surf, path)
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            self.assertEqual(GGO(path).at((0, 0)), (0, 255, 0))
+            # loaded for another display format, reloaded
+            mtime, fmt, old = cache[path]
+            self.assertEqual(fmt, gameObjects._display_format())
+            cache[path] = mtime, None, old
+            self.assertIsNot(gameObjects._source_surface(path), old)
+            self.assertEqual(cache[path][1], fmt)
+            gameObjects.clear_source_cache()
+            self.assertFalse(cache)
+            # bounded size
+            for i in range(gameObjects._SOURCE_SURFACES_MAX + 1):
+                p = op_.join(tmpdir, '{}.bmp'.format(i))
+                pygame.image.save(surf, p)
+                GGO(p)
+            self.assertLessEqual(len(cache), gameObjects._SOURCE_SURFACES_MAX)
+            gameObjects.clear_source_cache()
+
     def testLoadFromSurface(self):
         GGO = gameObjects.GenericGameObject
         GI = baseObjects.Image
@@ -445,15 +657,16 @@ class TestFromImageFiles(unittest.TestCase):
             self.assertEqual(obj1, obj2)
             self.assertEqual(obj1.rect, obj2.rect)
             self.assertEqual(obj1.area, obj2.area)
-            self.assertEqual(pygame.image.tostring(obj1.surface, "RGB"),
-                             pygame.image.tostring(obj2.surface, "RGB"))
+            self.assertTrue(same_pixels(obj1.surface, obj2.surface))
 
 
 class TestTextImageObject(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.fonts_path = list_files(FONTS_PATH)
+
     def setUp(self):
-        self.fonts_path = filter(op_.isfile,
-            glob.glob(op_.join(op_.realpath(FONTS_PATH), '*')))
         self.test_text = ''.join(choice(string.printable)
                                  for _ in range(randint(10,40)))
     def testArgs(self):
@@ -476,8 +689,7 @@ class TestTextImageObject(unittest.TestCase):
                 self.assertTrue(w > 0)
                 self.assertTrue(h > 0)
             for o1, o2 in pairs:
-                self.assertEqual(pygame.image.tostring(o1.surface, "RGB"),
-                                 pygame.image.tostring(o2.surface, "RGB"))
+                self.assertTrue(same_pixels(o1.surface, o2.surface))
                 self.assertEqual(o1.fg, o2.fg)
                 self.assertEqual(o1.bg, o2.bg)
             for o1, o2 in it.combinations(it.chain(*pairs), 2):
@@ -487,34 +699,57 @@ class TestTextImageObject(unittest.TestCase):
                 self.assertEqual(o1.fname, o2.fname)
 
     def testLoadAndResize(self):
+        for size in FONT_SIZES:
+            for font_path in self.fonts_path:
+                with self.subTest(size=size, font=font_path):
+                    self._testLoadAndResize(size)
+
+    def _testLoadAndResize(self, size):
         _r = randint
-        tostring = pygame.image.tostring
         text = self.test_text
-        for size in range(5, 50):
-            for font_path in self.fonts_path:
-                text_color = get_random_color()
-                bg_color = get_random_color()
-                # test (un)equality for TextImage
-                obj1 = gameObjects.TextImage(
-                    text, _DEF_FONT, _DEF_FONT_SIZE, text_color, bg_color)
-                obj2 = gameObjects.TextImage(
-                    text, _DEF_FONT, _DEF_FONT_SIZE, text_color, bg_color)
-                self.assertNotEqual(obj1, obj2)
-                # now, use the text as compare_value
-                obj1 = gameObjects.TextImage(
-                    text, _DEF_FONT, _DEF_FONT_SIZE, text_color, bg_color, text)
-                obj2 = gameObjects.TextImage(
-                    text, _DEF_FONT, _DEF_FONT_SIZE, text_color, bg_color, text)
-                for i in range(1, 10):
-                    w, h = tuple(_r(size, size*2) for x in 'hw')
-                    obj1.resize(w,h)
-                    obj2.resize(w,h)
-                    self.assertEqual(obj1, obj2)                    
-                    self.assertEqual(obj1.rect, obj2.rect)
-                    self.assertEqual(obj1.area, obj2.area)
-                    self.assertEqual(obj1.size, obj2.size)
-                    self.assertEqual(tostring(obj1.surface, "RGB"),
-                                     tostring(obj2.surface, "RGB"))
+        text_color = get_random_color()
+        bg_color = get_random_color()
+        # test (un)equality for TextImage
+        obj1 = gameObjects.TextImage(
+            text, _DEF_FONT, _DEF_FONT_SIZE, text_color, bg_color)
+        obj2 = gameObjects.TextImage(
+            text, _DEF_FONT, _DEF_FONT_SIZE, text_color, bg_color)
+        self.assertNotEqual(obj1, obj2)
+        # now, use the text as compare_value
+        obj1 = gameObjects.TextImage(
+            text, _DEF_FONT, _DEF_FONT_SIZE, text_color, bg_color, text)
+        obj2 = gameObjects.TextImage(
+            text, _DEF_FONT, _DEF_FONT_SIZE, text_color, bg_color, text)
+        for i in range(1, 10):
+            w, h = tuple(_r(size, size*2) for x in 'hw')
+            obj1.resize(w,h)
+            obj2.resize(w,h)
+            self.assertEqual(obj1, obj2)                    
+            self.assertEqual(obj1.rect, obj2.rect)
+            self.assertEqual(obj1.area, obj2.area)
+            self.assertEqual(obj1.size, obj2.size)
+            self.assertTrue(same_pixels(obj1.surface, obj2.surface))
+        # cached sizes match the font ones
+        for o in (obj1, obj2):
+            for t in (text, text[::-1], string.ascii_letters):
+                self.assertEqual(o.size_of(t), o._font.size(t))
+        # resized and new objects have the same pixel format
+        obj2.set_text(text[::-1])
+        obj3 = gameObjects.TextImage(
+            text, _DEF_FONT, _DEF_FONT_SIZE, text_color, bg_color)
+        for attr in ('get_bitsize', 'get_masks', 'get_shifts'):
+            for o in (obj1, obj2):
+                self.assertEqual(getattr(o.surfref, attr)(),
+                                 getattr(obj3.surfref, attr)())
+
+    def testResizeAfterSizeChange(self):
+        obj = gameObjects.TextImage(
+            self.test_text, _DEF_FONT, _DEF_FONT_SIZE, (0, 0, 0))
+        w, h = obj.size
+        obj.size = w * 3, h * 3
+        obj.resize(w * 3, h * 3)
+        self.assertEqual(obj.size, obj.surfref.get_size())
+        self.assertGreater(obj.h, h)
 
     def testMovement(self):
         _r = randint
@@ -547,12 +782,13 @@ class TestGrid (unittest.TestCase):
         for _ in range(20):
             self.setUp()
             self.assertEqual(self.grid.dims, (self.grows, self.gcols))
-            self.assertEquals(self.grid.size, self.gsize)
+            self.assertEqual(self.grid.size, self.gsize)
 
     def testGridShuffle (self):
         for _ in range(20):
+            # pixels are never read, keep the cells surfaces small.
             cell = gameObjects.GenericGameObject()
-            cell.resize(*[randint(1,50) for _ in 'wh'])
+            cell.resize(*[randint(1,4) for _ in 'wh'])
             self.grid.add([cell.copy() for _ in range(self.grows*self.gcols)])
             old = []
             for i, cell in enumerate(self.grid.values()):
@@ -606,6 +842,56 @@ class TestGrid (unittest.TestCase):
             rest = self.grid.add(objs)
             self.assertEqual(total, excess-len(rest))
 
+    def testGridUpdate (self):
+        GE = gameObjects.GenericGameObject
+        w, h = self.grid.size
+        cw, ch = w // self.gcols, h // self.grows
+        self.assertIsNone(self.grid.update())
+        self.assertEqual(self.grid.update(), [])
+        for _ in range(10):
+            pos = [(randint(0, self.grows-1), randint(0, self.gcols-1))
+                   for _ in range(randint(1, 10))]
+            for p in pos:
+                self.grid[p] = GE(pygame.Surface((cw, ch)))
+            left, top = self.grid.rect.topleft
+            # runs of adjacent cells in a row, as [row, first col, end col]
+            runs = []
+            for r, c in sorted(set(pos)):
+                if runs and runs[-1][0] == r and runs[-1][2] == c:
+                    runs[-1][2] += 1
+                else:
+                    runs.append([r, c, c + 1])
+            rects = [pygame.Rect(left + c0 * cw, top + r * ch,
+                                 (c1 - c0) * cw, ch) for r, c0, c1 in runs]
+            self.assertEqual(self.grid.update(), rects)
+            self.grid.move(*[randint(1, 100) for _ in 'xy'])
+            self.assertIsNone(self.grid.update())
+        total = self.grows * self.gcols
+        self.grid.add([GE() for _ in range(total)], overwrite=True)
+        # one rect per row
+        if self.grows > self.grid._max_dirty_rects:
+            self.assertIsNone(self.grid.update())
+        else:
+            left, top = self.grid.rect.topleft
+            self.assertEqual(self.grid.update(),
+                             [pygame.Rect(left, top + r * ch,
+                                          self.gcols * cw, ch)
+                              for r in range(self.grows)])
+        # methods redrawing the board by themselves keep
+        # the whole grid as changed for the next update.
+        grid = gameObjects.Grid(4, 5, (100, 80))
+        grid.add([GE(pygame.Surface((10, 10))) for _ in range(20)])
+        calls = ((grid.arrange, ()), (grid.shuffle, ()),
+                 (grid.move, (10, 10, True)),
+                 (grid.move_at, ((50, 50), const.TOPLEFT, True)),
+                 (grid.rebuild, ()), (grid.resize, (200, 160)))
+        for func, args in calls:
+            grid.update()
+            self.assertEqual(grid.update(), [])
+            func(*args)
+            self.assertIsNone(grid.update())
+            self.assertEqual(grid.update(), [])
+
 
 class TestBoardAndDisplay (unittest.TestCase):
 
@@ -76,6 +76,11 @@ def get_random_color ():
     return tuple(random.randint(0,255) for _ in 'rgba')
 
 
+def setUpModule ():
+    pygame.init()
+    get_screen()
+
+
 class TestConvert(unittest.TestCase):
 
     def testConvert (self):
@@ -171,6 +176,17 @@ class TestMisc (unittest.TestCase):
         for i in range(1, int(1e6)):
             self.assertGreaterEqual(operator.mul(*func(i)), i)
 
+    def testEdistance (self):
+        r = random.randint
+        for _ in range(1000):
+            seq1 = [r(-100, 100) for _ in range(r(0, 5))]
+            seq2 = [r(-100, 100) for _ in range(r(0, 5))]
+            dist = sum((a - b) ** 2 for a, b in zip(seq1, seq2)) ** .5
+            self.assertAlmostEqual(gameUtils.edistance(seq1, seq2), dist)
+            self.assertAlmostEqual(gameUtils.edistance(seq2, seq1), dist)
+            self.assertAlmostEqual(
+                gameUtils.edistance(iter(seq1), (x for x in seq2)), dist)
+
     def testTable (self):
         r = random.randint
         c = random.choice
@@ -179,41 +195,56 @@ class TestMisc (unittest.TestCase):
         args = []
         for _ in range(50):
             rows, cols = r(1, 100), r(1,100)
-            seq1 = [r(-100,100) for _ in range(0, rows*cols + r(10,40))]
-            seq2 = [r(-100,100) for _ in range(0, rows*cols - r(1, 10))]
+            values = range(-100, 101)
+            seq1 = random.choices(values, k=rows*cols + r(10,40))
+            seq2 = random.choices(values, k=max(0, rows*cols - r(1, 10)))
             args.append((rows,cols, c((None, E, "egg")), seq1))
             args.append((rows,cols, c((None, E, "egg")), seq2))
         for a in args:
             rows, cols, empty, seq = a
             table = Table(*a)
-            self.assertEquals(table, Table(*a))
-            self.assertEquals(table.size, (rows, cols))
-            self.assertNotEquals(table, Table(rows+1, cols, seq))
+            self.assertEqual(table, Table(*a))
+            self.assertEqual(table.size, (rows, cols))
+            self.assertNotEqual(table, Table(rows+1, cols, seq))
             if seq:
-                self.assertNotEquals(table, Table(rows, cols, empty))
-            self.assertNotEquals(table, Table(rows, cols-1, empty, seq))
-            self.assertEquals(rows, table.n_rows)
-            self.assertEquals(cols, table.n_cols)
-            self.assertEquals(empty, table.empty)
-            self.assertEquals(len(table), rows*cols)
+                self.assertNotEqual(table, Table(rows, cols, empty))
+            self.assertNotEqual(table, Table(rows, cols-1, empty, seq))
+            self.assertEqual(rows, table.n_rows)
+            self.assertEqual(cols, table.n_cols)
+            self.assertEqual(empty, table.empty)
+            self.assertEqual(len(table), rows*cols)
             if len(seq) >= rows*cols:
                 self.assertTrue(table.isfull)
-                for p, (_, item) in enumerate(table.items()):
-                    self.assertEquals(seq[p], item)
+                self.assertEqual([item for _, item in table.items()],
+                                 seq[:len(table)])
                 self.assertFalse(table.empty in table)
             else:
                 self.assertFalse(table.isfull)
                 self.assertTrue(table.empty in table)
-                for s, v in zip(seq, table.values()):
-                    self.assertEquals(s, v)
+                self.assertEqual(list(table.values())[:len(seq)], seq)
                 free = len(list(table.free()))
-                self.assertEquals(free, len(table) - len(seq), "%d %d" % (len(table),len(seq))  )
+                self.assertEqual(free, len(table) - len(seq), "%d %d" % (len(table),len(seq))  )
                 for i in seq:
                     self.assertTrue(i in table)
-            iters = zip(table.iter_pos(), table.values(), table.items())
-            for pos, val, (ipos, ival) in iters:
-                self.assertEquals(pos, ipos)
-                self.assertEquals(val, ival)
+            self.assertEqual(list(zip(table.iter_pos(), table.values())),
+                             list(table.items()))
+            shuffled = table.copy()
+            shuffled.shuffle()
+            self.assertEqual(shuffled.size, table.size)
+            self.assertEqual(sorted(map(str, shuffled)),
+                              sorted(map(str, table)))
+            # isfull follows the changes
+            for pos in list(table.free()):
+                self.assertFalse(table.isfull)
+                table[pos] = 0
+            self.assertTrue(table.isfull)
+            pos = (r(0, rows-1), r(0, cols-1))
+            table[pos] = table.empty
+            self.assertFalse(table.isfull)
+            table[pos] = table.empty
+            self.assertFalse(table.isfull)
+            table[pos] = 1
+            self.assertTrue(table.isfull)
 
     #TODO: test FakeSound
 
@@ -323,6 +354,18 @@ class Baz:
         res = sorted(bumpo.plugins.find_plugin_modules(self.bk_dir))
         self.assertEqual(sorted(files), res)
 
+    def testGetModule (self):
+        names = []
+        for i in range(5):
+            f = tempfile.NamedTemporaryFile(suffix='.py', dir=self.bk_dir,  delete=False)
+            f.write('NAME = {!r}\n'.format(i).encode('utf-8'))
+            f.close()
+            names.append(op_.splitext(op_.basename(f.name))[0])
+        for i, name in enumerate(names):
+            module = bumpo.plugins.get_module(name, [self.bk_dir])
+            self.assertEqual(module.NAME, i)
+        self.assertIsNone(bumpo.plugins.get_module('spam_eggs', [self.bk_dir]))
+
     def testLoadPlugin (self):
         modules = bumpo.plugins.find_plugin_modules()
         paths = bumpo.plugins.__path__
@@ -368,8 +411,6 @@ def load_tests(args=None):
 
 if __name__ == '__main__':
     os.chdir(pwd)
-    pygame.init()
-    get_screen()
     unittest.TextTestRunner(verbosity=2).run(
         unittest.TestSuite(load_tests(sys.argv[1:])))
     pygame.quit()